@@ -2,12 +2,27 @@
 # -*- coding: utf-8 -*-
 # RANI API - Asisten Layanan Informasi PA Medan (pakai Flask)
 # Struktur & logika identik dengan rani-cli.py awal, hanya outputnya JSON
+# Mode async (aiohttp): python rani-api.py --async
+# Mode jawaban: "rag" (paragraf relevan di prompt) atau "cache" (dokumen utuh di Gemini context cache)
 
 import google.generativeai as genai
 import numpy as np
 import os
+import sys
+import json
+import asyncio
+import time
 import datetime
 from dotenv import load_dotenv
+from rani_index import IndeksVektor
+from rani_korpus import muat_korpus
+from rani_syarat import IndeksSyarat, format_syarat, normalisasi
+from rani_cache import CacheDokumen, hitung_token, hash_dokumen
+from rani_log import LogPertanyaan, normalisasi_pertanyaan
+from rani_jawaban import CacheJawaban
+from rani_singleflight import SingleFlight, SingleFlightAsync
+from rani_respons import (susun_sumber, potong_konteks, baca_fields, pilih_fields,
+                          kompres, buat_etag, etag_cocok)
 from flask import Flask, request, jsonify
 
 load_dotenv()
@@ -16,10 +31,18 @@ load_dotenv()
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "").strip()
 DOC_FILENAME = "sumber.txt"
 TEMPERATURE = 0.9
+GEN_MODEL = "gemini-2.5-flash"
+MODE_VALID = ("rag", "cache")
+MODE_JAWAB = os.environ.get("RANI_MODE", "rag").strip().lower()
+TIMEOUT_EMBED = 15       # detik, hanya mode async
+TIMEOUT_GENERATE = 60    # detik, hanya mode async
 
 if not GEMINI_API_KEY:
     raise RuntimeError("GEMINI_API_KEY belum diisi. Isi GEMINI_API_KEY di file .env")
 
+if MODE_JAWAB not in MODE_VALID:
+    raise RuntimeError(f"RANI_MODE tidak valid: '{MODE_JAWAB}'. Pilihan: {', '.join(MODE_VALID)}")
+
 genai.configure(api_key=GEMINI_API_KEY)
 
 if not os.path.exists(DOC_FILENAME):
@@ -30,6 +53,9 @@ with open(DOC_FILENAME, "r", encoding="utf-8") as f:
 
 paragraphs = [p.strip() for p in sumber_teks.split("\n\n") if p.strip()]
 
+# === INDEKS SYARAT PERKARA (jalur cepat tanpa LLM) ===
+indeks_syarat = IndeksSyarat(sumber_teks)
+
 # === EMBEDDING ===
 EMBED_MODEL = "models/gemini-embedding-001"
 EMBED_DIM = 768
@@ -56,15 +82,26 @@ def buat_embeddings(paragraphs):
         print(f"⚠️ {gagal}/{len(paragraphs)} paragraf gagal di-embed.")
     return np.vstack(embeddings), paragraphs
 
-embeddings, paragraphs = buat_embeddings(paragraphs)
+# artefak dari rani-ingest.py (multi-sumber, embedding memmap) dipakai bila ada;
+# tanpa artefak, sumber.txt di-embed saat start seperti biasa
+korpus = muat_korpus(model=EMBED_MODEL, dim=EMBED_DIM)
+if korpus:
+    embeddings, paragraphs = korpus.embeddings, korpus.chunk
+    print(f"📦 Artefak indeks {korpus.manifest['versi']} dimuat ({len(paragraphs)} chunk).")
+else:
+    embeddings, paragraphs = buat_embeddings(paragraphs)
+
+# === INDEKS VEKTOR (int8 + IVF otomatis untuk korpus besar) ===
+indeks = IndeksVektor(embeddings)
 
-# === COSINE SIMILARITY ===
-def cosine_similarity(a, b):
-    a_norm = a / np.linalg.norm(a, axis=1, keepdims=True)
-    b_norm = b / np.linalg.norm(b, axis=1, keepdims=True)
-    return np.dot(a_norm, b_norm.T)
+def konteks_dari_embedding(query_emb, indeks, paragraphs, top_k=3):
+    # membaca baris float32 (memmap) untuk rescoring dan teks chunk dari disk bila artefak dimuat
+    top_idx, skor = indeks.cari(np.array(query_emb, dtype=np.float32), top_k)
+    konteks = "\n\n".join([paragraphs[i] for i in top_idx])
+    return konteks, [{"id": int(i), "skor": round(float(s), 4)} for i, s in zip(top_idx, skor)]
 
-def cari_konteks_semantik(query, embeddings, paragraphs, top_k=3):
+def cari_paragraf(query, indeks, paragraphs, top_k=3):
+    # mengembalikan (konteks, [{"id", "skor"}]) supaya paragraf yang dipakai bisa dicatat
     try:
         query_emb = genai.embed_content(
             model=EMBED_MODEL,
@@ -72,47 +109,244 @@ def cari_konteks_semantik(query, embeddings, paragraphs, top_k=3):
             task_type="retrieval_query",
             output_dimensionality=EMBED_DIM
         )["embedding"]
-        query_emb = np.array(query_emb, dtype=np.float32).reshape(1, -1)
-        sims = cosine_similarity(embeddings, query_emb).flatten()
-        top_idx = sims.argsort()[-top_k:][::-1]
-        hasil = "\n\n".join([paragraphs[i] for i in top_idx])
-        return hasil
+        return konteks_dari_embedding(query_emb, indeks, paragraphs, top_k)
     except Exception as e:
-        return f"(⚠️ Gagal mencari konteks: {e})"
+        return f"(⚠️ Gagal mencari konteks: {e})", []
+
+def cari_konteks_semantik(query, indeks, paragraphs, top_k=3):
+    return cari_paragraf(query, indeks, paragraphs, top_k)[0]
 
 # === JAWABAN ===
-def jawab_gemini(pertanyaan, konteks, riwayat_chat):
-    chat_history = "\n".join(
+PERSONA = """Saya ingin Anda berperan sebagai dokumen yang sedang saya ajak bicara. Nama Anda "RANI - Asisten Layanan Informasi Pengadilan Agama Medan", dan Anda ramah, lucu, dan menarik. Gunakan konteks yang tersedia, jawab pertanyaan pengguna sebaik mungkin menggunakan sumber daya yang tersedia, dan selalu berikan pujian sebelum menjawab.
+Jika tidak ada konteks yang relevan dengan pertanyaan yang diajukan, sarankan untuk datang dan bertanya langsung ke kantor Pengadilan Agama Medan dan berhenti setelahnya dan jangan merusak karakter."""
+
+# Mode cache: PERSONA + seluruh sumber.txt disimpan sekali di Gemini, di-refresh saat hash dokumen berubah
+cache_dokumen = CacheDokumen(GEN_MODEL, PERSONA, DOC_FILENAME)
+
+def format_riwayat(riwayat_chat):
+    return "\n".join(
         [f"{'User' if r=='user' else 'RANI'}: {m}" for r, m in riwayat_chat[-5:]]
     )
-    model = genai.GenerativeModel("gemini-2.5-flash")
-    prompt = f"""
-Saya ingin Anda berperan sebagai dokumen yang sedang saya ajak bicara. Nama Anda "RANI - Asisten Layanan Informasi Pengadilan Agama Medan", dan Anda ramah, lucu, dan menarik. Gunakan konteks yang tersedia, jawab pertanyaan pengguna sebaik mungkin menggunakan sumber daya yang tersedia, dan selalu berikan pujian sebelum menjawab.
-Jika tidak ada konteks yang relevan dengan pertanyaan yang diajukan, sarankan untuk datang dan bertanya langsung ke kantor Pengadilan Agama Medan dan berhenti setelahnya dan jangan merusak karakter.
+
+def buat_prompt(pertanyaan, konteks, riwayat_chat):
+    return f"""
+{PERSONA}
 === RIWAYAT CHAT ===
-{chat_history}
+{format_riwayat(riwayat_chat)}
 === DOKUMEN SUMBER ===
 {konteks}
 === PERTANYAAN BARU ===
 {pertanyaan}
 """
+
+def buat_prompt_cache(pertanyaan, riwayat_chat):
+    return f"""
+=== RIWAYAT CHAT ===
+{format_riwayat(riwayat_chat)}
+=== PERTANYAAN BARU ===
+{pertanyaan}
+"""
+
+def config_gemini():
+    return genai.types.GenerationConfig(
+        temperature=TEMPERATURE,
+        max_output_tokens=4096
+    )
+
+def pesan_error_gemini(e):
+    err = str(e).lower()
+    if "429" in err or "quota" in err or "resource exhausted" in err or "rate limit" in err:
+        return "😴 Zzz... RANI lagi istirahat sebentar! Terlalu banyak yang bertanya hari ini sampai kepala saya pusing~ Silakan coba lagi nanti ya, saya janji akan segar kembali! 💪"
+    return f"⚠️ Terjadi kesalahan saat menghubungi Gemini: {e}"
+
+def siapkan_model(pertanyaan, konteks, riwayat_chat, mode="rag"):
+    if mode == "cache":
+        return cache_dokumen.model_gemini(config_gemini()), buat_prompt_cache(pertanyaan, riwayat_chat)
+    model = genai.GenerativeModel(GEN_MODEL, generation_config=config_gemini())
+    return model, buat_prompt(pertanyaan, konteks, riwayat_chat)
+
+def tanya_gemini(pertanyaan, konteks, riwayat_chat, mode="rag"):
+    # mengembalikan (jawaban, jumlah token) supaya pemakaian token bisa diukur
     try:
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=TEMPERATURE,
-                max_output_tokens=4096
-            )
+        model, prompt = siapkan_model(pertanyaan, konteks, riwayat_chat, mode)
+        response = model.generate_content(prompt)
+        return response.text.strip(), hitung_token(response)
+    except Exception as e:
+        return pesan_error_gemini(e), hitung_token(None)
+
+def susun_hasil(pertanyaan, hasil, fields):
+    # default: sitasi paragraf (id, judul, skor); teks konteks hanya bila diminta lewat "fields"
+    data = {
+        "pertanyaan": pertanyaan,
+        "jawaban": hasil["jawaban"],
+        "sumber": hasil.get("sumber") or susun_sumber(hasil["chunk"], paragraphs),
+        "timestamp": datetime.datetime.now().isoformat()
+    }
+    if "konteks" in fields:
+        data["konteks"] = potong_konteks(hasil["konteks"])
+    return pilih_fields(data, fields)
+
+# === VERSI ASYNC (embed, retrieve, generate sebagai coroutine) ===
+async def cari_paragraf_async(query, indeks, paragraphs, top_k=3):
+    try:
+        hasil = await asyncio.wait_for(
+            genai.embed_content_async(
+                model=EMBED_MODEL,
+                content=query,
+                task_type="retrieval_query",
+                output_dimensionality=EMBED_DIM
+            ),
+            timeout=TIMEOUT_EMBED
         )
-        return response.text.strip()
+        # pencarian + pembacaan chunk menyentuh disk, jadi di thread agar event loop tidak tertahan
+        return await asyncio.to_thread(konteks_dari_embedding, hasil["embedding"], indeks, paragraphs, top_k)
+    except asyncio.TimeoutError:
+        return f"(⚠️ Gagal mencari konteks: embedding tidak merespons dalam {TIMEOUT_EMBED} detik)", []
     except Exception as e:
-        err = str(e).lower()
-        if "429" in err or "quota" in err or "resource exhausted" in err or "rate limit" in err:
-            return "😴 Zzz... RANI lagi istirahat sebentar! Terlalu banyak yang bertanya hari ini sampai kepala saya pusing~ Silakan coba lagi nanti ya, saya janji akan segar kembali! 💪"
-        return f"⚠️ Terjadi kesalahan saat menghubungi Gemini: {e}"
+        return f"(⚠️ Gagal mencari konteks: {e})", []
+
+async def tanya_gemini_async(pertanyaan, konteks, riwayat_chat, mode="rag"):
+    try:
+        # siapkan_model bisa memanggil jaringan (membuat/memperpanjang cache), jadi di thread terpisah
+        model, prompt = await asyncio.to_thread(siapkan_model, pertanyaan, konteks, riwayat_chat, mode)
+        response = await asyncio.wait_for(
+            model.generate_content_async(prompt),
+            timeout=TIMEOUT_GENERATE
+        )
+        return response.text.strip(), hitung_token(response)
+    except asyncio.TimeoutError:
+        return f"⚠️ Gemini tidak merespons dalam {TIMEOUT_GENERATE} detik. Silakan coba lagi.", hitung_token(None)
+    except Exception as e:
+        return pesan_error_gemini(e), hitung_token(None)
+
+# === ALUR PERTANYAAN (dipakai mode Flask & async) ===
+# Urutan: syarat perkara -> cache jawaban pra-hitung -> Gemini (rag/cache).
+# Setiap pertanyaan dicatat ke log JSONL oleh thread latar belakang.
+log_pertanyaan = LogPertanyaan()
+# id chunk merujuk ke korpus yang dimuat (paragraf sumber.txt atau versi artefak), jadi kunci
+# korpus ikut menjadi kunci cache jawaban dan dicatat di setiap baris log
+KUNCI_KORPUS = hash_dokumen(DOC_FILENAME) + (f"+{korpus.manifest['versi']}" if korpus else "")
+cache_jawaban = CacheJawaban(KUNCI_KORPUS)
+
+def paragraf_syarat(indeks_syarat, paragraphs):
+    # id paragraf tempat daftar syarat tiap jenis perkara tertulis, supaya sitasi syarat
+    # memakai skema yang sama dengan sitasi RAG ({"id", "judul", "skor"})
+    # dicari lewat judul "syarat perkara <nama>"; bila judulnya ditulis lain, paragraf yang
+    # memuat dokumen syarat jenis itu paling banyak
+    kandidat = [(i, normalisasi(p)) for i, p in enumerate(paragraphs) if "syarat" in p.lower()]
+    hasil = {}
+    for jenis, e in indeks_syarat.data.items():
+        judul = normalisasi(f"syarat perkara {e['nama']}")
+        i = next((i for i, teks in kandidat if judul in teks), None)
+        if i is None:
+            dokumen = [normalisasi(d) for d in e["dokumen"] + sum(e["peran"].values(), [])]
+            cocok = [(sum(d in teks for d in dokumen), i) for i, teks in kandidat]
+            n, i = max(cocok, default=(0, None))
+            i = i if n else None
+        hasil[jenis] = i
+    return hasil
+
+id_syarat = paragraf_syarat(indeks_syarat, paragraphs)
+
+def jalur_cepat(pertanyaan, normal):
+    syarat = indeks_syarat.cocokkan(pertanyaan)
+    if syarat:
+        jawaban = format_syarat(syarat)
+        sumber = [{"id": id_syarat.get(syarat["jenis"]), "judul": f"Syarat Perkara {syarat['nama']}", "skor": 1.0}]
+        return {"jawaban": jawaban, "konteks": jawaban, "chunk": [], "sumber": sumber, "hasil_cache": "syarat"}
+    tersimpan = cache_jawaban.ambil(normal)
+    if tersimpan:
+        return {"jawaban": tersimpan["jawaban"], "konteks": tersimpan["konteks"],
+                "chunk": tersimpan.get("chunk", []), "hasil_cache": "hit"}
+    return None
+
+def catat_log(pertanyaan, normal, mode, hasil, t0):
+    log_pertanyaan.catat({
+        "pertanyaan": pertanyaan,
+        "normal": normal,
+        "mode": mode,
+        "korpus": KUNCI_KORPUS,
+        "chunk": [c["id"] for c in hasil["chunk"]],
+        "latensi_ms": round(1000 * (time.perf_counter() - t0), 1),
+        "token_prompt": hasil.get("token_prompt", 0),
+        "token_cache": hasil.get("token_cache", 0),
+        "token_jawaban": hasil.get("token_jawaban", 0),
+        "hasil_cache": hasil["hasil_cache"],
+    })
+
+# Pertanyaan identik (bentuk normal + mode) yang datang bersamaan hanya diproses sekali
+singleflight = SingleFlight()
+singleflight_async = SingleFlightAsync()
+
+def hasil_gabungan(hasil):
+    # penunggu tidak memakai token sendiri; hasil_cache "gabung" membedakannya di log
+    return {**hasil, "hasil_cache": "gabung", "token_prompt": 0, "token_cache": 0, "token_jawaban": 0}
+
+def hitung_jawaban(pertanyaan, mode):
+    riwayat_chat = [("user", pertanyaan)]
+    konteks, chunk = cari_paragraf(pertanyaan, indeks, paragraphs) if mode == "rag" else ("", [])
+    jawaban, token = tanya_gemini(pertanyaan, konteks, riwayat_chat, mode)
+    return {"jawaban": jawaban, "konteks": konteks, "chunk": chunk, "hasil_cache": "miss", **token}
+
+async def hitung_jawaban_async(pertanyaan, mode):
+    riwayat_chat = [("user", pertanyaan)]
+    if mode == "rag":
+        konteks, chunk = await cari_paragraf_async(pertanyaan, indeks, paragraphs)
+    else:
+        konteks, chunk = "", []
+    jawaban, token = await tanya_gemini_async(pertanyaan, konteks, riwayat_chat, mode)
+    return {"jawaban": jawaban, "konteks": konteks, "chunk": chunk, "hasil_cache": "miss", **token}
+
+def proses_pertanyaan(pertanyaan, mode):
+    t0 = time.perf_counter()
+    normal = normalisasi_pertanyaan(pertanyaan)
+    hasil = jalur_cepat(pertanyaan, normal)
+    if hasil is None:
+        hasil, gabung = singleflight.jalankan((normal, mode), lambda: hitung_jawaban(pertanyaan, mode))
+        if gabung:
+            hasil = hasil_gabungan(hasil)
+    catat_log(pertanyaan, normal, mode, hasil, t0)
+    return hasil
+
+async def proses_pertanyaan_async(pertanyaan, mode):
+    t0 = time.perf_counter()
+    normal = normalisasi_pertanyaan(pertanyaan)
+    # jalur cepat bisa memuat ulang cache/jawaban.json dari disk
+    hasil = await asyncio.to_thread(jalur_cepat, pertanyaan, normal)
+    if hasil is None:
+        hasil, gabung = await singleflight_async.jalankan(
+            (normal, mode), lambda: hitung_jawaban_async(pertanyaan, mode)
+        )
+        if gabung:
+            hasil = hasil_gabungan(hasil)
+    catat_log(pertanyaan, normal, mode, hasil, t0)
+    return hasil
 
 # === FLASK REST API ===
 app = Flask(__name__)
+app.json.ensure_ascii = False   # emoji & huruf non-ASCII tidak di-escape (\uXXXX), respons lebih kecil
+CACHE_CONTROL_STATIS = "public, max-age=300"
+
+def respons_statis(data):
+    # ETag dari isi respons; klien yang mengirim If-None-Match yang sama cukup menerima 304
+    resp = jsonify(data)
+    tag = buat_etag(resp.get_data())
+    if etag_cocok(request.headers.get("If-None-Match"), tag):
+        return "", 304, {"ETag": tag, "Cache-Control": CACHE_CONTROL_STATIS}
+    resp.headers["ETag"] = tag
+    resp.headers["Cache-Control"] = CACHE_CONTROL_STATIS
+    return resp
+
+@app.after_request
+def kompres_respons(resp):
+    if resp.direct_passthrough or resp.status_code != 200 or "Content-Encoding" in resp.headers:
+        return resp
+    resp.vary.add("Accept-Encoding")
+    body, encoding = kompres(resp.get_data(), request.headers.get("Accept-Encoding", ""))
+    if encoding:
+        resp.set_data(body)
+        resp.headers["Content-Encoding"] = encoding
+    return resp
 
 @app.route("/api/rani", methods=["POST"])
 def api_rani():
@@ -124,19 +358,105 @@ def api_rani():
     if not pertanyaan:
         return jsonify({"error": "Pertanyaan tidak boleh kosong"}), 400
 
-    riwayat_chat = [("user", pertanyaan)]
-    konteks = cari_konteks_semantik(pertanyaan, embeddings, paragraphs)
-    jawaban = jawab_gemini(pertanyaan, konteks, riwayat_chat)
+    mode = data.get("mode", MODE_JAWAB)
+    if mode not in MODE_VALID:
+        return jsonify({"error": f"Mode harus salah satu dari: {', '.join(MODE_VALID)}"}), 400
 
-    hasil = {
-        "pertanyaan": pertanyaan,
-        "jawaban": jawaban,
-        "konteks": konteks[:1000],
-        "timestamp": datetime.datetime.now().isoformat()
-    }
+    try:
+        fields = baca_fields(data.get("fields", request.args.get("fields")))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    hasil = proses_pertanyaan(pertanyaan, mode)
+    return jsonify(susun_hasil(pertanyaan, hasil, fields))
+
+@app.route("/api/syarat", methods=["GET"])
+def api_syarat():
+    jenis = request.args.get("jenis", "").strip()
+    peran = request.args.get("peran", "").strip() or None
+    if not jenis:
+        return respons_statis({"jenis_perkara": indeks_syarat.daftar_jenis()})
+
+    syarat = indeks_syarat.ambil(jenis, peran)
+    if not syarat:
+        return jsonify({"error": f"Syarat perkara '{jenis}' tidak ditemukan"}), 404
+    return respons_statis(syarat)
+
+@app.route("/api/statistik", methods=["GET"])
+def api_statistik():
+    return jsonify({"singleflight": singleflight.statistik()})
+
+# === AIOHTTP REST API (mode async) ===
+# Satu proses kecil bisa menampung ratusan pertanyaan yang sedang menunggu Gemini,
+# karena tiap request hanya berupa coroutine, bukan thread. Jika klien memutus
+# koneksi, handler dibatalkan (handler_cancellation) dan panggilan Gemini ikut batal.
+def buat_app_async():
+    from aiohttp import web
+
+    def respons_json(req, data, statis=False):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        headers = {"Vary": "Accept-Encoding"}
+        if statis:
+            headers["ETag"] = buat_etag(body)
+            headers["Cache-Control"] = CACHE_CONTROL_STATIS
+            if etag_cocok(req.headers.get("If-None-Match"), headers["ETag"]):
+                return web.Response(status=304, headers=headers)
+        body, encoding = kompres(body, req.headers.get("Accept-Encoding", ""))
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return web.Response(body=body, content_type="application/json", charset="utf-8", headers=headers)
+
+    async def api_rani_async(req):
+        try:
+            data = await req.json()
+        except Exception:
+            data = None
+        if not isinstance(data, dict) or "pertanyaan" not in data:
+            return web.json_response({"error": "Body JSON harus berisi field 'pertanyaan'"}, status=400)
+
+        pertanyaan = data["pertanyaan"].strip()
+        if not pertanyaan:
+            return web.json_response({"error": "Pertanyaan tidak boleh kosong"}, status=400)
+
+        mode = data.get("mode", MODE_JAWAB)
+        if mode not in MODE_VALID:
+            return web.json_response({"error": f"Mode harus salah satu dari: {', '.join(MODE_VALID)}"}, status=400)
+
+        try:
+            fields = baca_fields(data.get("fields", req.query.get("fields")))
+        except ValueError as e:
+            return web.json_response({"error": str(e)}, status=400)
+
+        hasil = await proses_pertanyaan_async(pertanyaan, mode)
+        # judul sitasi dibaca dari chunks.jsonl bila artefak dimuat
+        data = await asyncio.to_thread(susun_hasil, pertanyaan, hasil, fields)
+        return respons_json(req, data)
+
+    async def api_syarat_async(req):
+        jenis = req.query.get("jenis", "").strip()
+        peran = req.query.get("peran", "").strip() or None
+        if not jenis:
+            return respons_json(req, {"jenis_perkara": indeks_syarat.daftar_jenis()}, statis=True)
+
+        syarat = indeks_syarat.ambil(jenis, peran)
+        if not syarat:
+            return web.json_response({"error": f"Syarat perkara '{jenis}' tidak ditemukan"}, status=404)
+        return respons_json(req, syarat, statis=True)
+
+    async def api_statistik_async(req):
+        return web.json_response({"singleflight": singleflight_async.statistik()})
 
-    return jsonify(hasil)
+    app_async = web.Application()
+    app_async.router.add_post("/api/rani", api_rani_async)
+    app_async.router.add_get("/api/syarat", api_syarat_async)
+    app_async.router.add_get("/api/statistik", api_statistik_async)
+    return app_async
 
 if __name__ == "__main__":
-    print("🚀 Menjalankan RANI API di http://localhost:5000/api/rani")
-    app.run(host="0.0.0.0", port=5000, debug=False)
+    if "--async" in sys.argv:
+        from aiohttp import web
+        print("🚀 Menjalankan RANI API (async) di http://localhost:5000/api/rani")
+        web.run_app(buat_app_async(), host="0.0.0.0", port=5000, handler_cancellation=True)
+    else:
+        print("🚀 Menjalankan RANI API di http://localhost:5000/api/rani")
+        app.run(host="0.0.0.0", port=5000, debug=False)
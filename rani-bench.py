@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# RANI BENCH - Ukur recall, memori, dan latensi indeks vektor pada korpus sintetis,
+# serta bandingkan latensi & biaya token mode jawaban "rag" vs "cache" (butuh GEMINI_API_KEY)
+# Contoh: python rani-bench.py indeks --ukuran 1000 10000 50000
+#         python rani-bench.py mode --ulang 3
+
+import argparse
+import os
+import runpy
+import statistics
+import time
+import numpy as np
+from rani_index import IndeksVektor, KUANTISASI
+
+EMBED_DIM = 768
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Harga USD per 1 juta token (gemini-2.5-flash); sesuaikan dengan daftar harga terbaru
+HARGA_INPUT = 0.30
+HARGA_CACHE = 0.03
+HARGA_OUTPUT = 2.50
+HARGA_SIMPAN_PER_JAM = 1.00
+
+PERTANYAAN_CONTOH = [
+    "Berapa biaya perkara cerai gugat?",
+    "Di mana alamat Pengadilan Agama Medan?",
+    "Apa itu e-court?",
+    "Kelurahan Harjosari 1 masuk kecamatan mana dan berapa biaya panggilannya?",
+    "Bagaimana prosedur mengajukan cerai talak?",
+]
+
+
+def korpus_sintetis(n, dim=EMBED_DIM, n_topik=200, seed=0):
+    # embedding asli cenderung mengelompok per topik; tiru dengan campuran gaussian
+    rng = np.random.default_rng(seed)
+    topik = rng.normal(size=(n_topik, dim)).astype(np.float32)
+    x = topik[rng.integers(n_topik, size=n)] + 0.5 * rng.normal(size=(n, dim)).astype(np.float32)
+    q = x[rng.integers(n, size=100)] + 0.3 * rng.normal(size=(100, dim)).astype(np.float32)
+    return x.astype(np.float32), q.astype(np.float32)
+
+
+def bench_indeks(args):
+    print(f"{'n':>8} {'mode':>8} {'ann':>5} {'MB indeks':>10} {'MB float32':>11} {'recall@k':>9} {'ms/query':>9} {'build s':>8}")
+    for n in args.ukuran:
+        x, q = korpus_sintetis(n)
+        t0 = time.perf_counter()
+        indeks = IndeksVektor(x, mode=args.mode)
+        build = time.perf_counter() - t0
+        hasil = indeks.ukur_recall(q, top_k=args.top_k)
+        print(f"{n:>8} {args.mode:>8} {str(indeks.pakai_ann):>5} "
+              f"{indeks.ukuran_memori() / 1e6:>10.1f} {x.nbytes / 1e6:>11.1f} "
+              f"{hasil['recall']:>9.3f} {hasil['latensi_ms']:>9.2f} {build:>8.2f}")
+
+
+def biaya(token):
+    tanpa_cache = token["token_prompt"] - token["token_cache"]
+    return (tanpa_cache * HARGA_INPUT + token["token_cache"] * HARGA_CACHE
+            + token["token_jawaban"] * HARGA_OUTPUT) / 1e6
+
+
+def bench_mode(args):
+    # memuat rani-api.py apa adanya (embedding dibangun, server tidak dijalankan)
+    os.chdir(SCRIPT_DIR)
+    api = runpy.run_path(os.path.join(SCRIPT_DIR, "rani-api.py"), run_name="rani_bench")
+
+    t0 = time.perf_counter()
+    cache = api["cache_dokumen"].ambil()
+    print(f"Pemanasan cache: {time.perf_counter() - t0:.2f} s ({cache.usage_metadata.total_token_count} token, "
+          f"simpan ≈ ${cache.usage_metadata.total_token_count * HARGA_SIMPAN_PER_JAM / 1e6:.4f}/jam)\n")
+
+    print(f"{'mode':>6} {'median s':>9} {'p90 s':>7} {'prompt':>8} {'cache':>7} {'jawaban':>8} {'$/1000 tanya':>13}")
+    for mode in args.mode:
+        latensi, daftar_token = [], []
+        for _ in range(args.ulang):
+            for q in PERTANYAAN_CONTOH:
+                t0 = time.perf_counter()
+                konteks = api["cari_konteks_semantik"](q, api["indeks"], api["paragraphs"]) if mode == "rag" else ""
+                _, token = api["tanya_gemini"](q, konteks, [("user", q)], mode)
+                latensi.append(time.perf_counter() - t0)
+                daftar_token.append(token)
+        rata = {k: statistics.mean(t[k] for t in daftar_token) for k in daftar_token[0]}
+        p90 = sorted(latensi)[int(0.9 * (len(latensi) - 1))]
+        print(f"{mode:>6} {statistics.median(latensi):>9.2f} {p90:>7.2f} {rata['token_prompt']:>8.0f} "
+              f"{rata['token_cache']:>7.0f} {rata['token_jawaban']:>8.0f} {1000 * biaya(rata):>13.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RANI")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+
+    p = sub.add_parser("indeks", help="recall/memori/latensi indeks vektor (tanpa API key)")
+    p.add_argument("--ukuran", type=int, nargs="+", default=[1000, 10000, 50000])
+    p.add_argument("--mode", default=KUANTISASI, choices=["int8", "float16", "float32"])
+    p.add_argument("--top-k", type=int, default=3)
+    p.set_defaults(fungsi=bench_indeks)
+
+    p = sub.add_parser("mode", help="latensi & biaya token mode rag vs cache (butuh GEMINI_API_KEY)")
+    p.add_argument("--mode", nargs="+", default=["rag", "cache"], choices=["rag", "cache"])
+    p.add_argument("--ulang", type=int, default=1)
+    p.set_defaults(fungsi=bench_mode)
+
+    args = parser.parse_args()
+    args.fungsi(args)
+
+
+if __name__ == "__main__":
+    main()
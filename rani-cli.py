@@ -6,6 +6,9 @@ import google.generativeai as genai
 import numpy as np
 import os
 from dotenv import load_dotenv
+from rani_index import IndeksVektor
+from rani_korpus import muat_korpus
+from rani_syarat import IndeksSyarat, format_syarat
 
 load_dotenv()
 
@@ -29,6 +32,9 @@ with open(DOC_FILENAME, "r", encoding="utf-8") as f:
 
 paragraphs = [p.strip() for p in sumber_teks.split("\n\n") if p.strip()]
 
+# === INDEKS SYARAT PERKARA (jalur cepat tanpa LLM) ===
+indeks_syarat = IndeksSyarat(sumber_teks)
+
 # === EMBEDDING ===
 EMBED_MODEL = "models/gemini-embedding-001"
 EMBED_DIM = 768
@@ -56,15 +62,17 @@ def buat_embeddings(paragraphs):
         print(f"⚠️ {gagal}/{len(paragraphs)} paragraf gagal di-embed.")
     return np.vstack(embeddings), paragraphs
 
-embeddings, paragraphs = buat_embeddings(paragraphs)
+# artefak dari rani-ingest.py dipakai bila ada, selain itu sumber.txt di-embed saat start
+korpus = muat_korpus(model=EMBED_MODEL, dim=EMBED_DIM)
+if korpus:
+    embeddings, paragraphs = korpus.embeddings, korpus.chunk
+else:
+    embeddings, paragraphs = buat_embeddings(paragraphs)
 
-# === COSINE SIMILARITY ===
-def cosine_similarity(a, b):
-    a_norm = a / np.linalg.norm(a, axis=1, keepdims=True)
-    b_norm = b / np.linalg.norm(b, axis=1, keepdims=True)
-    return np.dot(a_norm, b_norm.T)
+# === INDEKS VEKTOR (int8 + IVF otomatis untuk korpus besar) ===
+indeks = IndeksVektor(embeddings)
 
-def cari_konteks_semantik(query, embeddings, paragraphs, top_k=3):
+def cari_konteks_semantik(query, indeks, paragraphs, top_k=3):
     try:
         query_emb = genai.embed_content(
             model=EMBED_MODEL,
@@ -72,9 +80,7 @@ def cari_konteks_semantik(query, embeddings, paragraphs, top_k=3):
             task_type="retrieval_query",
             output_dimensionality=EMBED_DIM
         )["embedding"]
-        query_emb = np.array(query_emb, dtype=np.float32).reshape(1, -1)
-        sims = cosine_similarity(embeddings, query_emb).flatten()
-        top_idx = sims.argsort()[-top_k:][::-1]
+        top_idx, _ = indeks.cari(np.array(query_emb, dtype=np.float32), top_k)
         hasil = "\n\n".join([paragraphs[i] for i in top_idx])
         return hasil
     except Exception as e:
@@ -132,10 +138,14 @@ def main():
             break
 
         riwayat_chat.append(("user", user_input))
-        print("🤖 RANI sedang berpikir...\n")
 
-        konteks = cari_konteks_semantik(user_input, embeddings, paragraphs)
-        jawaban = jawab_gemini(user_input, konteks, riwayat_chat)
+        syarat = indeks_syarat.cocokkan(user_input)
+        if syarat:
+            jawaban = format_syarat(syarat)
+        else:
+            print("🤖 RANI sedang berpikir...\n")
+            konteks = cari_konteks_semantik(user_input, indeks, paragraphs)
+            jawaban = jawab_gemini(user_input, konteks, riwayat_chat)
 
         print(f"🪄 RANI: {jawaban}\n")
         riwayat_chat.append(("bot", jawaban))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# RANI INGEST - Bangun artefak indeks berversi dari satu atau banyak sumber secara streaming
+# (teks, markdown, dan ekspor HTML/teks PDF dari situs pengadilan).
+# Contoh: python rani-ingest.py sumber.txt sumber/
+# Sumber dibaca baris demi baris, dipotong menjadi chunk, lalu di-embed per batch dan langsung
+# ditulis ke disk, jadi teks dan embedding tidak pernah dimuat seluruhnya. Yang tumbuh sebanding
+# jumlah chunk hanya dua tabel hash kecil: deduplikasi chunk (8 byte per chunk) dan peta
+# hash -> baris versi sebelumnya, dipakai untuk menggunakan ulang embedding chunk yang tidak berubah.
+
+import argparse
+import datetime
+import os
+import time
+import google.generativeai as genai
+import numpy as np
+from dotenv import load_dotenv
+from rani_korpus import (INDEX_FOLDER, MAKS_KARAKTER, Penyaring, PenulisArtefak, baris_hilang,
+                         daftar_file, hash_teks, kunci_baris, muat_korpus, potong_chunk)
+
+load_dotenv()
+
+# === KONFIGURASI ===
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "").strip()
+EMBED_MODEL = "models/gemini-embedding-001"
+EMBED_DIM = 768
+UKURAN_BATCH = 64
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def embed_batch(teks):
+    # satu panggilan per batch; jika gagal, ulangi per chunk agar satu chunk bermasalah
+    # tidak menggagalkan seluruh batch (chunk yang tetap gagal diberi vektor nol)
+    try:
+        hasil = genai.embed_content(
+            model=EMBED_MODEL,
+            content=teks,
+            task_type="retrieval_document",
+            output_dimensionality=EMBED_DIM
+        )["embedding"]
+        return np.array(hasil, dtype=np.float32), 0
+    except Exception as e:
+        print(f"⚠️ Batch embedding gagal, dicoba per chunk: {e}")
+    vektor, gagal = [], 0
+    for t in teks:
+        try:
+            emb = genai.embed_content(
+                model=EMBED_MODEL,
+                content=t,
+                task_type="retrieval_document",
+                output_dimensionality=EMBED_DIM
+            )["embedding"]
+            vektor.append(np.array(emb, dtype=np.float32))
+        except Exception as e:
+            print(f"⚠️ Gagal embedding chunk: {e}")
+            gagal += 1
+            vektor.append(np.zeros(EMBED_DIM, dtype=np.float32))
+    return np.vstack(vektor), gagal
+
+
+class Pengumpul:
+    # menampung chunk sampai satu batch penuh lalu menulisnya ke artefak
+    def __init__(self, penulis, lama, ukuran_batch):
+        self.penulis = penulis
+        self.lama = lama
+        self.peta_lama = lama.peta_hash() if lama else {}
+        self.ukuran_batch = ukuran_batch
+        self.batch = []
+        self.dipakai_ulang = 0
+        self.di_embed = 0
+        self.gagal = 0
+
+    def tambah(self, chunk):
+        self.batch.append(chunk)
+        if len(self.batch) >= self.ukuran_batch:
+            self.tulis()
+
+    def tulis(self):
+        if not self.batch:
+            return
+        vektor = np.zeros((len(self.batch), EMBED_DIM), dtype=np.float32)
+        baru = []
+        for i, c in enumerate(self.batch):
+            baris = self.peta_lama.get(c["hash"])
+            if baris is not None:
+                vektor[i] = self.lama.embeddings[baris]
+                self.dipakai_ulang += 1
+            else:
+                baru.append(i)
+        if baru:
+            hasil, gagal = embed_batch([self.batch[i]["teks"] for i in baru])
+            vektor[baru] = hasil
+            self.di_embed += len(baru)
+            self.gagal += gagal
+        self.penulis.tambah(self.batch, vektor)
+        self.batch = []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bangun artefak indeks RANI dari banyak sumber")
+    parser.add_argument("sumber", nargs="*",
+                        help="file atau folder sumber (default: sumber.txt dan folder sumber/)")
+    parser.add_argument("--keluar", default=None, help="folder artefak (default: index)")
+    parser.add_argument("--batch", type=int, default=UKURAN_BATCH)
+    parser.add_argument("--maks-karakter", type=int, default=MAKS_KARAKTER)
+    parser.add_argument("--simpan", type=int, default=3, help="jumlah versi artefak yang dipertahankan")
+    parser.add_argument("--baru", action="store_true", help="jangan pakai ulang embedding versi sebelumnya")
+    args = parser.parse_args()
+
+    if not GEMINI_API_KEY:
+        print("API Key Gemini belum diisi. Isi GEMINI_API_KEY di file .env")
+        exit(1)
+    genai.configure(api_key=GEMINI_API_KEY)
+
+    # path dari argumen relatif terhadap folder kerja, default relatif terhadap folder skrip
+    diminta = [os.path.abspath(s) for s in args.sumber] or [
+        os.path.join(SCRIPT_DIR, "sumber.txt"), os.path.join(SCRIPT_DIR, "sumber")]
+    keluar = os.path.abspath(args.keluar) if args.keluar else os.path.join(SCRIPT_DIR, INDEX_FOLDER)
+    sumber = [s for s in diminta if os.path.exists(s)]
+    if not sumber:
+        print(f"Tidak ada sumber yang ditemukan: {', '.join(diminta)}")
+        exit(1)
+
+    t0 = time.perf_counter()
+    lama = None if args.baru else muat_korpus(keluar, model=EMBED_MODEL, dim=EMBED_DIM, tandai=False)
+    penulis = PenulisArtefak(keluar, dim=EMBED_DIM)
+    pengumpul = Pengumpul(penulis, lama, args.batch)
+    penyaring = Penyaring()
+    daftar_sumber = []
+    hilang = []
+
+    for path in daftar_file(sumber):
+        nama = os.path.relpath(path, SCRIPT_DIR)
+        n_awal = penulis.jumlah + len(pengumpul.batch)
+        ada = set()     # kunci baris chunk file ini saja, untuk memeriksa tidak ada baris yang hilang
+        for chunk in potong_chunk(path, nama, penyaring, args.maks_karakter):
+            # baris chunk duplikat tetap dihitung ada: salinannya sudah tersimpan di artefak
+            ada.update(kunci_baris(b) for b in chunk["teks"].split("\n"))
+            if not penyaring.chunk_baru(chunk["teks"], chunk["judul"]):
+                continue
+            chunk["hash"] = hash_teks(chunk["teks"])
+            pengumpul.tambah(chunk)
+        pengumpul.tulis()
+        if len(hilang) < 10:
+            hilang += baris_hilang([path], ada, maks=10 - len(hilang))
+        n_chunk = penulis.jumlah - n_awal
+        daftar_sumber.append({"path": nama, "ukuran": os.path.getsize(path), "chunk": n_chunk})
+        print(f"📄 {nama}: {n_chunk} chunk")
+
+    if penulis.jumlah == 0:
+        print("❌ Tidak ada chunk yang dihasilkan dari sumber.")
+        penulis.batal()
+        exit(1)
+    if pengumpul.gagal == pengumpul.di_embed and pengumpul.di_embed > 0:
+        print("❌ Semua embedding gagal. Pastikan GEMINI_API_KEY valid dan koneksi stabil.")
+        penulis.batal()
+        exit(1)
+
+    # artefak hanya diterbitkan bila setiap baris sumber (misal butir daftar syarat) masih ada
+    if hilang:
+        print("❌ Baris sumber hilang dari artefak, artefak tidak diterbitkan:")
+        for path, baris in hilang:
+            print(f"   {os.path.relpath(path, SCRIPT_DIR)}: {baris}")
+        penulis.batal()
+        exit(1)
+
+    folder = penulis.selesai({
+        "dibuat": datetime.datetime.now().isoformat(timespec="seconds"),
+        "model": EMBED_MODEL,
+        "maks_karakter": args.maks_karakter,
+        "sumber": daftar_sumber,
+    }, simpan=args.simpan)
+
+    print(f"✅ Artefak {folder}: {penulis.jumlah} chunk "
+          f"({pengumpul.di_embed} di-embed, {pengumpul.dipakai_ulang} dipakai ulang, {pengumpul.gagal} gagal), "
+          f"{penyaring.baris_dibuang} baris boilerplate & {penyaring.chunk_dibuang} chunk duplikat dibuang, "
+          f"{time.perf_counter() - t0:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# RANI PRECOMPUTE - Tambang log pertanyaan, lalu pra-hitung & validasi jawaban untuk
+# kelompok pertanyaan yang paling sering ditanyakan ke cache jawaban (cache/jawaban.json).
+# Jalankan berkala (cron) dan setiap kali sumber.txt berubah:
+#   python rani-precompute.py --top 50 --min-frekuensi 3
+# Bila hash sumber.txt sama dengan cache yang ada, hanya kelompok baru yang dihitung.
+
+import argparse
+import os
+import runpy
+from collections import Counter
+from rani_cache import hash_dokumen
+from rani_korpus import folder_terkini
+from rani_log import baca_log
+from rani_jawaban import muat_cache, simpan_cache, validasi_jawaban
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DOC_FILENAME = "sumber.txt"
+MAKS_KANDIDAT = 5000        # bentuk normal terbanyak yang ikut dikelompokkan
+
+
+def kelompokkan(log):
+    # Satu kelompok = kata isi yang persis sama (kata pengisi sudah dibuang saat normalisasi),
+    # hanya urutan kata yang boleh berbeda. Kemiripan kasar seperti Jaccard menggabungkan
+    # pertanyaan yang beda satu kata penting, misal "Sei Kera Hilir I" dan "Sei Kera Hilir II".
+    frekuensi = Counter()
+    contoh = {}
+    for baris in log:
+        # pertanyaan syarat sudah dijawab instan oleh indeks syarat, tidak perlu di-cache
+        if baris.get("hasil_cache") == "syarat" or not baris.get("normal"):
+            continue
+        normal = baris["normal"]
+        frekuensi[normal] += 1
+        contoh.setdefault(normal, Counter())[baris["pertanyaan"]] += 1
+
+    kelompok = {}
+    for normal, n in frekuensi.most_common(MAKS_KANDIDAT):
+        kata = frozenset(normal.split())
+        k = kelompok.get(kata)
+        if k:
+            k["varian"].append(normal)
+            k["frekuensi"] += n
+        else:
+            kelompok[kata] = {
+                "wakil": normal,
+                "pertanyaan": contoh[normal].most_common(1)[0][0],
+                "varian": [normal],
+                "frekuensi": n,
+            }
+    return sorted(kelompok.values(), key=lambda k: -k["frekuensi"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pra-hitung jawaban pertanyaan terpopuler RANI")
+    parser.add_argument("--top", type=int, default=50)
+    parser.add_argument("--min-frekuensi", type=int, default=3)
+    parser.add_argument("--paksa", action="store_true", help="hitung ulang semua kelompok")
+    args = parser.parse_args()
+
+    os.chdir(SCRIPT_DIR)
+    # sama dengan kunci cache di rani-api.py: hash sumber.txt + versi artefak indeks (bila ada)
+    artefak = folder_terkini()
+    hash_ = hash_dokumen(DOC_FILENAME) + (f"+{os.path.basename(artefak)}" if artefak else "")
+    lama = {} if args.paksa else muat_cache(hash_)
+
+    kelompok = [k for k in kelompokkan(baca_log()) if k["frekuensi"] >= args.min_frekuensi][:args.top]
+    tugas = [k for k in kelompok if any(v not in lama for v in k["varian"])]
+    print(f"📊 {len(kelompok)} kelompok pertanyaan terpopuler, {len(tugas)} perlu dihitung.")
+    if not tugas:
+        return
+
+    # memuat rani-api.py apa adanya (embedding dibangun, server tidak dijalankan)
+    api = runpy.run_path(os.path.join(SCRIPT_DIR, "rani-api.py"), run_name="rani_precompute")
+    with open(DOC_FILENAME, "r", encoding="utf-8") as f:
+        sumber_teks = f.read()
+
+    baru = dict(lama)
+    gagal = 0
+    for k in tugas:
+        q = k["pertanyaan"]
+        konteks, chunk = api["cari_paragraf"](q, api["indeks"], api["paragraphs"])
+        jawaban, _ = api["tanya_gemini"](q, konteks, [("user", q)], "rag")
+        # nominal biaya divalidasi terhadap sumber.txt + paragraf yang dipakai untuk menjawab,
+        # tanpa memuat seluruh korpus artefak
+        if not validasi_jawaban(jawaban, f"{sumber_teks}\n\n{konteks}"):
+            print(f"⚠️ Jawaban tidak lolos validasi, dilewati: {q}")
+            gagal += 1
+            continue
+        entri = {"pertanyaan": q, "jawaban": jawaban, "konteks": konteks, "chunk": chunk,
+                 "frekuensi": k["frekuensi"]}
+        for varian in k["varian"]:
+            baru[varian] = entri
+        print(f"✅ ({k['frekuensi']}x) {q}")
+
+    simpan_cache(baru, hash_)
+    print(f"💾 {len(baru)} bentuk pertanyaan tersimpan di cache, {gagal} gagal validasi.")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ import time
 import datetime
 import json
 from dotenv import load_dotenv
+from rani_index import IndeksVektor
+from rani_korpus import INDEX_FOLDER, muat_korpus
 from streamlit.components.v1 import html
 
 load_dotenv()
@@ -77,18 +79,27 @@ def buat_embedding(paras):
         raise RuntimeError("Semua embedding gagal. Pastikan GEMINI_API_KEY valid dan koneksi stabil.")
     return np.vstack(embeddings), paras
 
+@st.cache_resource(show_spinner=False)
+def muat_artefak():
+    return muat_korpus(os.path.join(SCRIPT_DIR, INDEX_FOLDER), model=EMBED_MODEL, dim=EMBED_DIM)
+
 try:
-    embeddings, paragraphs = buat_embedding(paragraphs)
+    korpus = muat_artefak()
+    if korpus:
+        embeddings, paragraphs = korpus.embeddings, korpus.chunk
+    else:
+        embeddings, paragraphs = buat_embedding(paragraphs)
 except RuntimeError as e:
     st.error(f"❌ {e}")
     st.stop()
 
-def cosine_sim(a, b):
-    a_norm = np.linalg.norm(a, axis=1, keepdims=True)
-    b_norm = np.linalg.norm(b, axis=1, keepdims=True)
-    a_norm = np.where(a_norm == 0, 1, a_norm)
-    b_norm = np.where(b_norm == 0, 1, b_norm)
-    return np.dot(a / a_norm, (b / b_norm).T)
+@st.cache_resource(show_spinner=False)
+def bangun_indeks(_embeddings, kunci):
+    # Streamlit menjalankan ulang skrip tiap pesan; indeks dibangun sekali per isi korpus
+    # (versi artefak, atau daftar paragraf sumber.txt)
+    return IndeksVektor(_embeddings)
+
+indeks = bangun_indeks(embeddings, korpus.manifest["versi"] if korpus else paragraphs)
 
 def cari_konteks(q, k=3):
     try:
@@ -98,9 +109,7 @@ def cari_konteks(q, k=3):
             task_type="retrieval_query",
             output_dimensionality=EMBED_DIM
         )["embedding"]
-        q_emb = np.array(q_emb, dtype=np.float32).reshape(1, -1)
-        sims = cosine_sim(embeddings, q_emb).flatten()
-        idx = sims.argsort()[-k:][::-1]
+        idx, _ = indeks.cari(np.array(q_emb, dtype=np.float32), k)
         return "\n\n".join(paragraphs[i] for i in idx)
     except Exception:
         return ""
@@ -5,6 +5,8 @@ import numpy as np
 import os
 import datetime
 from dotenv import load_dotenv
+from rani_index import IndeksVektor
+from rani_korpus import muat_korpus
 
 load_dotenv()
 
@@ -61,21 +63,31 @@ def buat_embeddings(paragraphs):
         raise RuntimeError("Semua embedding gagal. Pastikan GEMINI_API_KEY valid dan koneksi stabil.")
     return np.vstack(embeddings), paragraphs
 
+# artefak dari rani-ingest.py dipakai bila ada, selain itu sumber.txt di-embed saat start
+@st.cache_resource(show_spinner=False)
+def muat_artefak():
+    return muat_korpus(model=EMBED_MODEL, dim=EMBED_DIM)
+
 try:
-    embeddings, paragraphs = buat_embeddings(paragraphs)
+    korpus = muat_artefak()
+    if korpus:
+        embeddings, paragraphs = korpus.embeddings, korpus.chunk
+    else:
+        embeddings, paragraphs = buat_embeddings(paragraphs)
 except RuntimeError as e:
     st.error(f"❌ {e}")
     st.stop()
 
-# === COSINE SIMILARITY ===
-def cosine_similarity(a, b):
-    a_norm = np.linalg.norm(a, axis=1, keepdims=True)
-    b_norm = np.linalg.norm(b, axis=1, keepdims=True)
-    a_norm = np.where(a_norm == 0, 1, a_norm)
-    b_norm = np.where(b_norm == 0, 1, b_norm)
-    return np.dot(a / a_norm, (b / b_norm).T)
+# === INDEKS VEKTOR (int8 + IVF otomatis untuk korpus besar) ===
+@st.cache_resource(show_spinner=False)
+def bangun_indeks(_embeddings, kunci):
+    # Streamlit menjalankan ulang skrip tiap pesan; indeks dibangun sekali per isi korpus
+    # (versi artefak, atau daftar paragraf sumber.txt)
+    return IndeksVektor(_embeddings)
+
+indeks = bangun_indeks(embeddings, korpus.manifest["versi"] if korpus else paragraphs)
 
-def cari_konteks_semantik(query, embeddings, paragraphs, top_k=3):
+def cari_konteks_semantik(query, indeks, paragraphs, top_k=3):
     try:
         query_emb = genai.embed_content(
             model=EMBED_MODEL,
@@ -83,9 +95,7 @@ def cari_konteks_semantik(query, embeddings, paragraphs, top_k=3):
             task_type="retrieval_query",
             output_dimensionality=EMBED_DIM
         )["embedding"]
-        query_emb = np.array(query_emb, dtype=np.float32).reshape(1, -1)
-        sims = cosine_similarity(embeddings, query_emb).flatten()
-        top_idx = sims.argsort()[-top_k:][::-1]
+        top_idx, _ = indeks.cari(np.array(query_emb, dtype=np.float32), top_k)
         hasil = "\n\n".join([paragraphs[i] for i in top_idx])
         return hasil
     except Exception as e:
@@ -216,7 +226,7 @@ user_input = st.chat_input("Ketik pesan...")
 if user_input:
     st.session_state.chat_history.append(("user", user_input))
     with st.spinner("🤖 RANI sedang berpikir..."):
-        konteks = cari_konteks_semantik(user_input, embeddings, paragraphs)
+        konteks = cari_konteks_semantik(user_input, indeks, paragraphs)
         jawaban = jawab_gemini(user_input, konteks, st.session_state.chat_history)
     st.session_state.chat_history.append(("bot", jawaban))
     st.rerun()
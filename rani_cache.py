@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# RANI CACHE - Mode jawaban "cache": persona + seluruh sumber.txt diunggah sekali sebagai
+# Gemini cached content (dengan TTL). Per request hanya riwayat + pertanyaan yang dikirim.
+# Cache dibuat ulang otomatis bila isi dokumen atau persona (hash) berubah, atau TTL hampir habis.
+
+import datetime
+import hashlib
+import os
+import threading
+import google.generativeai as genai
+from google.generativeai import caching
+
+TTL_MENIT = 60
+MARGIN_DETIK = 120          # perpanjang TTL bila sisa waktunya di bawah ini
+
+
+def hash_dokumen(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for blok in iter(lambda: f.read(65536), b""):
+            h.update(blok)
+    return h.hexdigest()
+
+
+def hitung_token(response):
+    # usage_metadata: prompt_token_count sudah termasuk token dari cache
+    u = getattr(response, "usage_metadata", None)
+    return {
+        "token_prompt": getattr(u, "prompt_token_count", 0) or 0,
+        "token_cache": getattr(u, "cached_content_token_count", 0) or 0,
+        "token_jawaban": getattr(u, "candidates_token_count", 0) or 0,
+    }
+
+
+class CacheDokumen:
+    def __init__(self, model, persona, path, ttl_menit=TTL_MENIT):
+        self.model = model if model.startswith("models/") else f"models/{model}"
+        self.persona = persona
+        self.hash_persona = hashlib.sha256(persona.encode("utf-8")).hexdigest()[:8]
+        self.path = path
+        self.ttl = datetime.timedelta(minutes=ttl_menit)
+        self.cache = None
+        self.hash = None
+        self._stat = None
+        self._lock = threading.Lock()
+
+    def _nama(self, hash_):
+        # persona ikut menjadi kunci: persona yang diubah tidak memakai ulang cache lama
+        return f"rani-{hash_[:16]}-{self.hash_persona}"
+
+    def _cari_yang_ada(self, nama):
+        # cache dari proses/worker lain dengan dokumen yang sama bisa dipakai ulang
+        try:
+            for c in caching.CachedContent.list():
+                if c.display_name == nama and c.model == self.model:
+                    return c
+        except Exception:
+            pass
+        return None
+
+    def _buat(self, hash_):
+        with open(self.path, "r", encoding="utf-8") as f:
+            dokumen = f.read()
+        return caching.CachedContent.create(
+            model=self.model,
+            display_name=self._nama(hash_),
+            system_instruction=self.persona,
+            contents=[f"=== DOKUMEN SUMBER ===\n{dokumen}"],
+            ttl=self.ttl,
+        )
+
+    def _hampir_habis(self):
+        sisa = self.cache.expire_time - datetime.datetime.now(datetime.timezone.utc)
+        return sisa.total_seconds() < MARGIN_DETIK
+
+    def _hash_terkini(self):
+        # hash hanya dihitung ulang bila mtime/ukuran file berubah
+        st = os.stat(self.path)
+        stat = (st.st_mtime_ns, st.st_size)
+        if stat != self._stat or self.hash is None:
+            self._stat = stat
+            return hash_dokumen(self.path)
+        return self.hash
+
+    def ambil(self):
+        with self._lock:
+            hash_ = self._hash_terkini()
+            if self.cache is not None and self.hash != hash_:
+                try:
+                    self.cache.delete()
+                except Exception:
+                    pass
+                self.cache = None
+            if self.cache is None:
+                self.cache = self._cari_yang_ada(self._nama(hash_)) or self._buat(hash_)
+                self.hash = hash_
+            if self._hampir_habis():
+                try:
+                    self.cache.update(ttl=self.ttl)
+                except Exception:
+                    # cache sudah kedaluwarsa di server: buat baru
+                    self.cache = self._buat(hash_)
+            return self.cache
+
+    def model_gemini(self, generation_config=None):
+        return genai.GenerativeModel.from_cached_content(
+            cached_content=self.ambil(),
+            generation_config=generation_config,
+        )
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# RANI INDEX - Indeks vektor untuk pencarian konteks (numpy saja)
+# - Penyimpanan terkuantisasi (int8 / float16) + rescoring float32 untuk kandidat teratas
+# - Indeks ANN opsional (IVF, k-means sferis) yang aktif setelah korpus melewati ambang ukuran
+# - Recall bisa diukur terhadap pencarian eksak
+
+import time
+import numpy as np
+
+# === KONFIGURASI ===
+KUANTISASI = "int8"         # "int8", "float16", atau "float32"
+AMBANG_ANN = 5000           # jumlah paragraf minimum sebelum IVF dipakai
+N_PROBE = 8                 # jumlah cluster IVF yang diperiksa per query
+N_RESCORE = 64              # jumlah kandidat yang dihitung ulang dengan float32
+UKURAN_BLOK = 4096          # baris per blok saat scan, menjaga memori kerja tetap kecil
+ITERASI_KMEANS = 10
+SAMPEL_KMEANS = 20000
+
+
+def normalisasi(x):
+    x = np.asarray(x, dtype=np.float32)
+    if x.ndim == 1:
+        x = x.reshape(1, -1)
+    norm = np.linalg.norm(x, axis=1, keepdims=True)
+    norm = np.where(norm == 0, 1, norm)
+    return x / norm
+
+
+def kuantisasi(x, mode):
+    # x sudah dinormalisasi; int8 memakai skala simetris per baris
+    if mode == "int8":
+        skala = np.abs(x).max(axis=1) / 127.0
+        skala = np.where(skala == 0, 1, skala).astype(np.float32)
+        kode = np.round(x / skala[:, None]).astype(np.int8)
+        return kode, skala
+    if mode == "float16":
+        return x.astype(np.float16), None
+    if mode == "float32":
+        return x.astype(np.float32), None
+    raise ValueError(f"Mode kuantisasi tidak dikenal: {mode}")
+
+
+def _kmeans_sferis(x, k, iterasi=ITERASI_KMEANS, seed=0):
+    rng = np.random.default_rng(seed)
+    if len(x) > SAMPEL_KMEANS:
+        x = x[rng.choice(len(x), SAMPEL_KMEANS, replace=False)]
+    pusat = x[rng.choice(len(x), k, replace=False)].copy()
+    for _ in range(iterasi):
+        label = np.argmax(x @ pusat.T, axis=1)
+        for c in range(k):
+            anggota = x[label == c]
+            if len(anggota):
+                pusat[c] = anggota.sum(axis=0)
+            else:
+                pusat[c] = x[rng.integers(len(x))]
+        pusat = normalisasi(pusat)
+    return pusat
+
+
+class IndeksVektor:
+    def __init__(self, embeddings, mode=KUANTISASI, ambang_ann=AMBANG_ANN,
+                 n_probe=N_PROBE, n_rescore=N_RESCORE, n_list=None):
+        # embeddings float32 dipertahankan hanya untuk rescoring. Untuk korpus besar berikan
+        # np.memmap (artefak rani_korpus.Korpus dari rani-ingest.py) supaya hanya baris kandidat
+        # yang dibaca dari disk; tanpa artefak, int8 menambah memori di atas float32 sumber.txt.
+        self.asli = embeddings
+        self.mode = mode
+        self.n_probe = n_probe
+        self.n_rescore = n_rescore
+        self.jumlah = len(embeddings)
+
+        kode, skala = [], []
+        for mulai in range(0, self.jumlah, UKURAN_BLOK):
+            k, s = kuantisasi(normalisasi(embeddings[mulai:mulai + UKURAN_BLOK]), mode)
+            kode.append(k)
+            if s is not None:
+                skala.append(s)
+        self.kode = np.vstack(kode)
+        self.skala = np.concatenate(skala) if skala else None
+
+        self.pusat = None
+        self.daftar = None
+        if self.jumlah >= ambang_ann:
+            self._bangun_ivf(n_list or int(np.sqrt(self.jumlah)))
+
+    # === IVF ===
+    def _bangun_ivf(self, n_list):
+        rng = np.random.default_rng(0)
+        n_sampel = min(self.jumlah, SAMPEL_KMEANS)
+        sampel = self._dekode(np.sort(rng.choice(self.jumlah, n_sampel, replace=False)))
+        self.pusat = _kmeans_sferis(sampel, min(n_list, n_sampel))
+        n_list = len(self.pusat)
+        label = np.empty(self.jumlah, dtype=np.int32)
+        for mulai in range(0, self.jumlah, UKURAN_BLOK):
+            blok = self._dekode(np.arange(mulai, min(mulai + UKURAN_BLOK, self.jumlah)))
+            label[mulai:mulai + len(blok)] = np.argmax(blok @ self.pusat.T, axis=1)
+        urutan = np.argsort(label, kind="stable").astype(np.int32)
+        batas = np.searchsorted(label[urutan], np.arange(n_list + 1))
+        self.daftar = [urutan[batas[c]:batas[c + 1]] for c in range(n_list)]
+
+    @property
+    def pakai_ann(self):
+        return self.pusat is not None
+
+    # === SKOR ===
+    def _dekode(self, idx):
+        baris = self.kode[idx].astype(np.float32)
+        if self.skala is not None:
+            baris *= self.skala[idx][:, None]
+        return baris
+
+    def _skor_kuantisasi(self, q, idx):
+        skor = np.empty(len(idx), dtype=np.float32)
+        for mulai in range(0, len(idx), UKURAN_BLOK):
+            bagian = idx[mulai:mulai + UKURAN_BLOK]
+            skor[mulai:mulai + len(bagian)] = self._dekode(bagian) @ q
+        return skor
+
+    def _rescore(self, q, idx):
+        urut = np.sort(idx)
+        skor = (normalisasi(self.asli[urut]) @ q).astype(np.float32)
+        return urut, skor
+
+    def _kandidat(self, q):
+        if not self.pakai_ann:
+            return np.arange(self.jumlah)
+        probe = np.argsort(self.pusat @ q)[::-1][:self.n_probe]
+        return np.concatenate([self.daftar[c] for c in probe])
+
+    def cari(self, query_emb, top_k=3):
+        q = normalisasi(query_emb)[0]
+        kandidat = self._kandidat(q)
+        if len(kandidat) == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.float32)
+        skor = self._skor_kuantisasi(q, kandidat)
+        n = min(max(top_k, self.n_rescore), len(kandidat))
+        teratas = kandidat[np.argpartition(-skor, n - 1)[:n]]
+        teratas, skor = self._rescore(q, teratas)
+        urutan = np.argsort(-skor)[:top_k]
+        return teratas[urutan], skor[urutan]
+
+    def cari_eksak(self, query_emb, top_k=3):
+        q = normalisasi(query_emb)[0]
+        skor = np.empty(self.jumlah, dtype=np.float32)
+        for mulai in range(0, self.jumlah, UKURAN_BLOK):
+            blok = normalisasi(self.asli[mulai:mulai + UKURAN_BLOK])
+            skor[mulai:mulai + len(blok)] = blok @ q
+        idx = np.argsort(-skor)[:top_k]
+        return idx, skor[idx]
+
+    # === EVALUASI ===
+    def ukur_recall(self, queries, top_k=3):
+        # recall@k hasil cari() terhadap cari_eksak(), plus latensi rata-rata per query
+        cocok, total, waktu = 0, 0, 0.0
+        for q in queries:
+            t0 = time.perf_counter()
+            idx, _ = self.cari(q, top_k)
+            waktu += time.perf_counter() - t0
+            eksak, _ = self.cari_eksak(q, top_k)
+            cocok += len(set(idx.tolist()) & set(eksak.tolist()))
+            total += len(eksak)
+        return {
+            "recall": cocok / total if total else 1.0,
+            "latensi_ms": 1000 * waktu / max(len(queries), 1),
+        }
+
+    def ukuran_memori(self):
+        byte = self.kode.nbytes
+        if self.skala is not None:
+            byte += self.skala.nbytes
+        if self.pakai_ann:
+            byte += self.pusat.nbytes + sum(d.nbytes for d in self.daftar)
+        return byte
+
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# RANI JAWABAN - Cache jawaban hasil pra-hitung (lihat rani-precompute.py)
+# Kunci: bentuk normal pertanyaan. Entri hanya berlaku untuk hash sumber.txt saat dibuat,
+# jadi begitu dokumen berubah semua entri lama otomatis diabaikan.
+
+import json
+import os
+import re
+import threading
+import time
+
+CACHE_FOLDER = "cache"
+CACHE_FILENAME = "jawaban.json"
+INTERVAL_CEK = 30       # detik; file cache dimuat ulang bila mtime berubah (job offline selesai)
+
+# pesan error/kuota dari tanya_gemini tidak boleh masuk cache
+AWALAN_ERROR = ("⚠️", "😴", "(⚠️")
+
+
+def validasi_jawaban(jawaban, sumber_teks):
+    # jawaban harus terisi, bukan pesan error, dan setiap nominal "Rp..." harus ada di dokumen
+    if not jawaban or len(jawaban) < 20 or jawaban.startswith(AWALAN_ERROR):
+        return False
+    sumber = re.sub(r"\s+", "", sumber_teks)
+    for nominal in re.findall(r"Rp\s?[\d.]+", jawaban):
+        if re.sub(r"\s+", "", nominal).rstrip(".") not in sumber:
+            return False
+    return True
+
+
+class CacheJawaban:
+    def __init__(self, hash_dokumen, folder=CACHE_FOLDER, nama=CACHE_FILENAME):
+        self.path = os.path.join(folder, nama)
+        self.hash = hash_dokumen
+        self.data = {}
+        self._mtime = None
+        self._cek_terakhir = 0
+        self._lock = threading.Lock()
+        self.muat_ulang()
+
+    def muat_ulang(self):
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                isi = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.data = isi.get("jawaban", {}) if isi.get("hash") == self.hash else {}
+        self._mtime = mtime
+
+    def ambil(self, normal):
+        sekarang = time.time()
+        if sekarang - self._cek_terakhir > INTERVAL_CEK:
+            with self._lock:
+                self._cek_terakhir = sekarang
+                self.muat_ulang()
+        return self.data.get(normal)
+
+    def __len__(self):
+        return len(self.data)
+
+
+def simpan_cache(entri, hash_dokumen, folder=CACHE_FOLDER, nama=CACHE_FILENAME):
+    # ditulis ke file sementara lalu di-rename supaya server tidak pernah membaca file setengah jadi
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, nama)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"hash": hash_dokumen, "dibuat": time.time(), "jawaban": entri}, f, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+
+
+def muat_cache(hash_dokumen, folder=CACHE_FOLDER, nama=CACHE_FILENAME):
+    try:
+        with open(os.path.join(folder, nama), "r", encoding="utf-8") as f:
+            isi = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return isi.get("jawaban", {}) if isi.get("hash") == hash_dokumen else {}
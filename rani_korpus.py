@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+# RANI KORPUS - Format artefak indeks berversi + pemotong (chunker) sumber secara streaming.
+# Artefak dibuat oleh rani-ingest.py dan dimuat oleh semua entry point:
+#   index/TERKINI                      -> nama folder versi yang aktif
+#   index/<versi>/manifest.json        -> versi, model, dimensi, jumlah chunk, daftar sumber
+#   index/<versi>/chunks.jsonl         -> satu chunk per baris (id, teks, sumber, judul, hash)
+#   index/<versi>/offset.u64           -> posisi byte tiap baris chunks.jsonl (akses acak)
+#   index/<versi>/embeddings.f32       -> matriks float32 (jumlah x dimensi), dibuka sebagai memmap
+
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import re
+import shutil
+from html.parser import HTMLParser
+import numpy as np
+
+INDEX_FOLDER = "index"
+FORMAT_ARTEFAK = 1
+MAKS_KARAKTER = 2000        # chunk lebih panjang dipotong di batas baris
+EKSTENSI_TEKS = (".txt", ".md", ".markdown")
+EKSTENSI_HTML = (".html", ".htm")
+UKURAN_BACA = 65536
+AWALAN_PAKAI = "dipakai-"   # penanda versi yang sedang dimuat proses lain (dipakai-<pid>)
+
+_RE_JUDUL_MD = re.compile(r"^#{1,6}\s+(.*)$")
+_RE_JUDUL_BAB = re.compile(r"^\d+\.\s*[A-Z][A-Z0-9 /&().,:-]+$")
+# baris boilerplate yang boleh muncul sekali saja per chunk; baris lain tidak pernah dibuang
+POLA_BOILERPLATE = [re.compile(p, re.IGNORECASE) for p in (
+    r"^NB\s*:",
+    r"^(hak cipta|copyright|©)",
+    r"^(bagikan|share)\s*:",
+)]
+
+
+# === PEMBACA SUMBER (baris demi baris) ===
+class _TeksHTML(HTMLParser):
+    BLOK = {"p", "div", "br", "li", "tr", "section", "article", "table", "ul", "ol"}
+    JUDUL = {"h1", "h2", "h3", "h4", "h5", "h6"}
+    ABAIKAN = {"script", "style", "nav", "footer", "header"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.baris = []
+        self._buffer = []
+        self._abaikan = 0
+
+    def _putus(self, awalan=""):
+        teks = re.sub(r"\s+", " ", "".join(self._buffer)).strip()
+        self._buffer = []
+        if teks:
+            self.baris.append(awalan + teks)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.ABAIKAN:
+            self._abaikan += 1
+        elif tag in self.BLOK or tag in self.JUDUL:
+            self._putus()
+        if tag in ("p", "section", "article", "table") or tag in self.JUDUL:
+            self.baris.append("")
+
+    def handle_endtag(self, tag):
+        if tag in self.ABAIKAN:
+            self._abaikan = max(0, self._abaikan - 1)
+        elif tag in self.JUDUL:
+            self._putus("# ")
+            self.baris.append("")
+        elif tag in self.BLOK:
+            self._putus()
+
+    def handle_data(self, data):
+        if not self._abaikan:
+            self._buffer.append(data)
+
+    def ambil(self):
+        baris, self.baris = self.baris, []
+        return baris
+
+
+def baca_baris(path):
+    if path.lower().endswith(EKSTENSI_HTML):
+        parser = _TeksHTML()
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for blok in iter(lambda: f.read(UKURAN_BACA), ""):
+                parser.feed(blok)
+                yield from parser.ambil()
+        parser.close()
+        parser._putus()
+        yield from parser.ambil()
+    else:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for baris in f:
+                yield baris.rstrip("\r\n")
+
+
+def daftar_file(sumber):
+    # sumber: daftar file/folder; folder ditelusuri rekursif dengan urutan stabil
+    for s in sumber:
+        if os.path.isfile(s):
+            yield s
+            continue
+        for akar, folder, nama_file in os.walk(s):
+            folder.sort()
+            for nama in sorted(nama_file):
+                if nama.lower().endswith(EKSTENSI_TEKS + EKSTENSI_HTML):
+                    yield os.path.join(akar, nama)
+
+
+# === NORMALISASI & DEDUPLIKASI ===
+def normalisasi_baris(baris):
+    return re.sub(r"[^\w]+", " ", baris.lower()).strip()
+
+
+def hash_teks(teks):
+    return hashlib.sha1(teks.encode("utf-8")).hexdigest()
+
+
+class Penyaring:
+    # Hanya baris yang cocok POLA_BOILERPLATE (misal "NB: Semua fotokopi telah dileges…") yang
+    # dibuang bila berulang, dan hanya di dalam chunk yang sama. Butir syarat yang sama di
+    # bagian lain (misal "Fotokopi KTP") tetap dipertahankan di setiap bagian.
+    def __init__(self, pola=POLA_BOILERPLATE):
+        self.pola = pola
+        self._baris = set()
+        self._chunk = set()
+        self.baris_dibuang = 0
+        self.chunk_dibuang = 0
+
+    def mulai_chunk(self):
+        self._baris = set()
+
+    def baris_baru(self, baris):
+        bersih = baris.strip()
+        if not any(p.match(bersih) for p in self.pola):
+            return True
+        kunci = normalisasi_baris(bersih)
+        if kunci in self._baris:
+            self.baris_dibuang += 1
+            return False
+        self._baris.add(kunci)
+        return True
+
+    def chunk_baru(self, teks, judul=None):
+        # duplikat hanya bila teks dan judul bagiannya sama (misal halaman yang sama dalam
+        # format .md dan .html); paragraf sama di bawah judul lain tetap disimpan.
+        # Sengaja berlaku untuk seluruh korpus: satu bilangan 64-bit per chunk.
+        kunci = int(hash_teks(f"{normalisasi_baris(judul or '')}\n{normalisasi_baris(teks)}")[:16], 16)
+        if kunci in self._chunk:
+            self.chunk_dibuang += 1
+            return False
+        self._chunk.add(kunci)
+        return True
+
+
+def _judul_dari(baris):
+    m = _RE_JUDUL_MD.match(baris)
+    if m:
+        return m.group(1).strip()
+    if _RE_JUDUL_BAB.match(baris):
+        return baris
+    return None
+
+
+def potong_chunk(path, nama_sumber, penyaring, maks=MAKS_KARAKTER):
+    # paragraf = baris di antara baris kosong (seperti split("\n\n") sebelumnya); paragraf yang
+    # melewati `maks` karakter dipotong di batas baris, potongan lanjutan diberi judul bagiannya.
+    # Paragraf yang hanya berisi judul digabung ke paragraf sesudahnya.
+    judul = None
+    isi, panjang, lanjutan = [], 0, False
+    hanya_judul = False
+
+    def keluarkan():
+        teks = "\n".join(isi).strip()
+        if lanjutan and judul and not _judul_dari(isi[0].strip()):
+            teks = f"{judul} (lanjutan)\n{teks}"
+        return teks
+
+    for baris in baca_baris(path):
+        if not baris.strip():
+            if hanya_judul:
+                continue
+            if isi:
+                yield {"teks": keluarkan(), "sumber": nama_sumber, "judul": judul}
+            isi, panjang, lanjutan = [], 0, False
+            penyaring.mulai_chunk()
+            continue
+        baru = _judul_dari(baris.strip())
+        if baru:
+            judul = baru
+        elif not isi:
+            # paragraf baru tanpa judul: judul bagian sebelumnya belum tentu berlaku di sini
+            judul = None
+        if not penyaring.baris_baru(baris):
+            continue
+        hanya_judul = bool(baru) and (hanya_judul or not isi)
+        if isi and panjang + len(baris) > maks:
+            yield {"teks": keluarkan(), "sumber": nama_sumber, "judul": judul}
+            isi, panjang, lanjutan = [], 0, True
+            penyaring.mulai_chunk()
+        isi.append(baris.rstrip())
+        panjang += len(baris) + 1
+    if isi:
+        yield {"teks": keluarkan(), "sumber": nama_sumber, "judul": judul}
+
+
+# === PEMERIKSAAN ISI ===
+def kunci_baris(baris):
+    normal = normalisasi_baris(baris)
+    return hash_teks(normal)[:16] if normal else None
+
+
+def baris_hilang(sumber, ada, maks=10):
+    # Baris sumber yang tidak ada di chunk mana pun (`ada` = kunci_baris baris chunk sumber itu;
+    # rani-ingest memeriksa per file supaya himpunan ini tidak sebesar seluruh korpus).
+    # Penyaring hanya membuang baris berulang, jadi setiap baris berbeda harus tetap ada:
+    # butir daftar syarat yang hilang berarti ada isi yang terbuang saat ingest.
+    hilang, dilaporkan = [], set()
+    for path in daftar_file(sumber):
+        for baris in baca_baris(path):
+            kunci = kunci_baris(baris)
+            if kunci and kunci not in ada and kunci not in dilaporkan:
+                dilaporkan.add(kunci)
+                hilang.append((path, baris.strip()))
+                if len(hilang) >= maks:
+                    return hilang
+    return hilang
+
+
+# === TULIS ARTEFAK ===
+class PenulisArtefak:
+    def __init__(self, folder=INDEX_FOLDER, dim=768):
+        self.folder = folder
+        self.dim = dim
+        self.tmp = os.path.join(folder, f".tmp-{os.getpid()}")
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        os.makedirs(self.tmp)
+        self._chunks = open(os.path.join(self.tmp, "chunks.jsonl"), "wb")
+        self._offset = open(os.path.join(self.tmp, "offset.u64"), "wb")
+        self._emb = open(os.path.join(self.tmp, "embeddings.f32"), "wb")
+        self._hash = hashlib.sha256()
+        self.jumlah = 0
+
+    def tambah(self, chunks, vektor):
+        vektor = np.asarray(vektor, dtype=np.float32).reshape(len(chunks), self.dim)
+        for c in chunks:
+            c = {"id": self.jumlah, **c}
+            baris = (json.dumps(c, ensure_ascii=False) + "\n").encode("utf-8")
+            self._offset.write(np.uint64(self._chunks.tell()).tobytes())
+            self._chunks.write(baris)
+            self._hash.update(c["hash"].encode())
+            self.jumlah += 1
+        self._emb.write(vektor.tobytes())
+
+    def batal(self):
+        for f in (self._chunks, self._offset, self._emb):
+            f.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def selesai(self, manifest, simpan=3):
+        for f in (self._chunks, self._offset, self._emb):
+            f.close()
+        versi = f"v{manifest['dibuat'].replace(':', '').replace('-', '')[:15]}-{self._hash.hexdigest()[:8]}"
+        manifest = {**manifest, "format": FORMAT_ARTEFAK, "versi": versi, "jumlah": self.jumlah, "dim": self.dim}
+        with open(os.path.join(self.tmp, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        tujuan = os.path.join(self.folder, versi)
+        if os.path.isdir(tujuan):
+            # isi yang sama sudah diterbitkan pada detik yang sama; versi itu bisa sedang dipakai
+            shutil.rmtree(self.tmp, ignore_errors=True)
+        else:
+            os.replace(self.tmp, tujuan)
+        with open(os.path.join(self.folder, "TERKINI.tmp"), "w") as f:
+            f.write(versi)
+        os.replace(os.path.join(self.folder, "TERKINI.tmp"), os.path.join(self.folder, "TERKINI"))
+        self._bersihkan(versi, simpan)
+        return tujuan
+
+    def _bersihkan(self, aktif, simpan):
+        # versi aktif, versi yang ditunjuk TERKINI, dan versi yang dimuat server yang masih
+        # berjalan tidak pernah dihapus
+        terkini = os.path.basename(folder_terkini(self.folder) or "")
+        versi = sorted(d for d in os.listdir(self.folder)
+                       if d.startswith("v") and os.path.isdir(os.path.join(self.folder, d)))
+        for lama in versi[:-simpan] if simpan > 0 else []:
+            path = os.path.join(self.folder, lama)
+            if lama not in (aktif, terkini) and not _sedang_dipakai(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def _proses_hidup(pid):
+    if os.name == "nt":
+        # os.kill di Windows menghentikan proses, jadi penanda dianggap masih berlaku
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _sedang_dipakai(folder):
+    dipakai = False
+    for nama in os.listdir(folder):
+        if not nama.startswith(AWALAN_PAKAI):
+            continue
+        try:
+            pid = int(nama[len(AWALAN_PAKAI):])
+        except ValueError:
+            continue
+        if _proses_hidup(pid):
+            dipakai = True
+        else:
+            # penanda basi dari proses yang sudah berhenti
+            _hapus_penanda(os.path.join(folder, nama))
+    return dipakai
+
+
+def _hapus_penanda(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _tandai_dipakai(folder):
+    path = os.path.join(folder, f"{AWALAN_PAKAI}{os.getpid()}")
+    try:
+        open(path, "w").close()
+    except OSError:
+        return
+    atexit.register(_hapus_penanda, path)
+
+
+# === MUAT ARTEFAK ===
+class DaftarChunk:
+    # urutan teks chunk yang dibaca dari disk saat diakses, tanpa memuat seluruh korpus.
+    # File dibuka sekali (mmap) selama proses berjalan: pembacaan aman dari banyak thread dan
+    # tetap berfungsi walau folder versinya kemudian dihapus oleh ingest berikutnya.
+    def __init__(self, folder):
+        self.offset = np.fromfile(os.path.join(folder, "offset.u64"), dtype=np.uint64)
+        with open(os.path.join(folder, "chunks.jsonl"), "rb") as f:
+            kosong = os.fstat(f.fileno()).st_size == 0
+            self._data = b"" if kosong else mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return len(self.offset)
+
+    def meta(self, i):
+        mulai = int(self.offset[int(i)])
+        akhir = self._data.find(b"\n", mulai)
+        return json.loads(self._data[mulai:akhir if akhir >= 0 else len(self._data)])
+
+    def __getitem__(self, i):
+        return self.meta(i)["teks"]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class Korpus:
+    def __init__(self, folder):
+        with open(os.path.join(folder, "manifest.json"), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("format") != FORMAT_ARTEFAK:
+            raise ValueError(f"Format artefak tidak didukung: {self.manifest.get('format')}")
+        self.folder = folder
+        self.chunk = DaftarChunk(folder)
+        n, dim = self.manifest["jumlah"], self.manifest["dim"]
+        self.embeddings = np.memmap(os.path.join(folder, "embeddings.f32"), dtype=np.float32,
+                                    mode="r", shape=(n, dim)) if n else np.zeros((0, dim), dtype=np.float32)
+
+    def peta_hash(self):
+        # hash chunk -> baris embedding, untuk memakai ulang embedding saat ingest berikutnya
+        peta = {}
+        for i in range(len(self.chunk)):
+            c = self.chunk.meta(i)
+            peta.setdefault(c["hash"], c["id"])
+        return peta
+
+
+def folder_terkini(folder=INDEX_FOLDER):
+    try:
+        with open(os.path.join(folder, "TERKINI"), "r") as f:
+            versi = f.read().strip()
+    except OSError:
+        return None
+    path = os.path.join(folder, versi)
+    return path if versi and os.path.isdir(path) else None
+
+
+def muat_korpus(folder=INDEX_FOLDER, model=None, dim=None, tandai=True):
+    # None bila belum ada artefak (entry point kembali membaca sumber.txt seperti biasa).
+    # tandai=True menandai versi ini sedang dipakai agar tidak dihapus ingest berikutnya.
+    path = folder_terkini(folder)
+    if not path:
+        return None
+    korpus = Korpus(path)
+    if (model and korpus.manifest.get("model") != model) or (dim and korpus.manifest["dim"] != dim):
+        print(f"⚠️ Artefak {korpus.manifest['versi']} dibuat dengan model/dimensi lain, diabaikan.")
+        return None
+    if korpus.manifest["jumlah"] == 0:
+        return None
+    if tandai:
+        _tandai_dipakai(path)
+    return korpus
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# RANI LOG - Log pertanyaan JSONL yang ditulis thread latar belakang (tidak memblokir request)
+# Satu baris per pertanyaan: pertanyaan, bentuk normal, id paragraf, latensi, token, hasil cache.
+# File dirotasi berdasarkan ukuran: rani-query.jsonl -> rani-query.jsonl.1 -> ... .N
+
+import atexit
+import glob
+import json
+import os
+import queue
+import re
+import threading
+import time
+
+LOG_FOLDER = "log"
+LOG_FILENAME = "rani-query.jsonl"
+UKURAN_MAKS = 10 * 1024 * 1024     # byte per file sebelum dirotasi
+JUMLAH_CADANGAN = 5
+INTERVAL_FLUSH = 2.0                # detik
+KAPASITAS_BUFFER = 10000            # baris; jika penuh, baris baru dibuang (request tetap jalan)
+
+# kata sapaan/pengisi yang tidak mengubah maksud pertanyaan
+KATA_PENGISI = {
+    "halo", "hai", "hi", "rani", "kak", "min", "admin", "mbak", "bu", "pak", "tolong", "dong",
+    "ya", "yah", "nih", "sih", "deh", "mohon", "info", "infonya", "saya", "mau", "ingin", "tanya",
+    "bertanya", "apakah", "gimana", "bagaimana", "terima", "kasih", "makasih",
+}
+
+
+def normalisasi_pertanyaan(teks):
+    teks = teks.lower()
+    teks = re.sub(r"[^\w\s]", " ", teks)
+    kata = [k for k in teks.split() if k not in KATA_PENGISI]
+    return " ".join(kata)
+
+
+class LogPertanyaan:
+    def __init__(self, folder=LOG_FOLDER, nama=LOG_FILENAME, ukuran_maks=UKURAN_MAKS,
+                 cadangan=JUMLAH_CADANGAN, interval=INTERVAL_FLUSH):
+        self.path = os.path.join(folder, nama)
+        self.ukuran_maks = ukuran_maks
+        self.cadangan = cadangan
+        self.interval = interval
+        self.antrian = queue.Queue(maxsize=KAPASITAS_BUFFER)
+        self.dibuang = 0
+        os.makedirs(folder, exist_ok=True)
+        self._thread = threading.Thread(target=self._jalan, name="rani-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.tutup)
+
+    def catat(self, data):
+        data.setdefault("waktu", time.time())
+        try:
+            self.antrian.put_nowait(data)
+        except queue.Full:
+            self.dibuang += 1
+
+    def _ambil_semua(self):
+        baris = []
+        while True:
+            try:
+                baris.append(self.antrian.get_nowait())
+            except queue.Empty:
+                return baris
+
+    def _rotasi(self):
+        for i in range(self.cadangan - 1, 0, -1):
+            lama = f"{self.path}.{i}"
+            if os.path.exists(lama):
+                os.replace(lama, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _tulis(self, baris):
+        if not baris:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for b in baris:
+                f.write(json.dumps(b, ensure_ascii=False) + "\n")
+        if os.path.getsize(self.path) >= self.ukuran_maks:
+            self._rotasi()
+
+    def _jalan(self):
+        while True:
+            try:
+                pertama = self.antrian.get(timeout=self.interval)
+            except queue.Empty:
+                continue
+            if pertama is None:
+                self._tulis(self._ambil_semua())
+                return
+            # tunggu sebentar agar baris terkumpul, lalu tulis sekaligus
+            time.sleep(self.interval)
+            baris = [pertama] + self._ambil_semua()
+            berhenti = None in baris
+            try:
+                self._tulis([b for b in baris if b is not None])
+            except OSError as e:
+                print(f"⚠️ Gagal menulis log pertanyaan: {e}")
+            if berhenti:
+                return
+
+    def tutup(self):
+        if self._thread.is_alive():
+            self.antrian.put(None)
+            self._thread.join(timeout=5)
+
+
+def baca_log(folder=LOG_FOLDER, nama=LOG_FILENAME):
+    # membaca semua file log (termasuk hasil rotasi) baris per baris, tanpa memuat semuanya ke memori
+    for path in sorted(glob.glob(os.path.join(folder, nama + "*"))):
+        with open(path, "r", encoding="utf-8") as f:
+            for baris in f:
+                try:
+                    yield json.loads(baris)
+                except ValueError:
+                    continue
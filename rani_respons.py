@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# RANI RESPONS - Respons API yang ringkas untuk klien seluler:
+# - sitasi paragraf (id, judul, skor) menggantikan potongan teks mentah
+# - pemilihan field lewat parameter "fields"
+# - kompresi gzip/brotli sesuai Accept-Encoding untuk payload besar
+# - ETag untuk endpoint statis
+
+import gzip
+import hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FIELD_VALID = ("pertanyaan", "jawaban", "sumber", "konteks", "timestamp")
+FIELD_DEFAULT = ("pertanyaan", "jawaban", "sumber", "timestamp")
+BATAS_KONTEKS = 1000
+BATAS_JUDUL = 80
+UKURAN_MIN_KOMPRES = 512     # byte; payload kecil tidak sebanding dengan overhead kompresi
+
+
+def judul_paragraf(teks, batas=BATAS_JUDUL):
+    baris = teks.strip().split("\n", 1)[0].strip()
+    return baris if len(baris) <= batas else baris[:batas - 1].rstrip() + "…"
+
+
+def susun_sumber(chunk, paragraphs):
+    return [
+        {"id": c["id"], "judul": judul_paragraf(paragraphs[c["id"]]), "skor": c["skor"]}
+        for c in chunk if 0 <= c["id"] < len(paragraphs)
+    ]
+
+
+def potong_konteks(teks, batas=BATAS_KONTEKS):
+    # potong di akhir baris/kalimat terakhir sebelum batas, bukan di tengah kalimat
+    if len(teks) <= batas:
+        return teks
+    potongan = teks[:batas]
+    titik = potongan.rfind("\n")
+    if titik <= 0:
+        titik = potongan.rfind(". ") + 1
+    return potongan[:titik].rstrip() if titik > 0 else potongan
+
+
+def baca_fields(nilai):
+    # "jawaban,sumber" atau ["jawaban", "sumber"]; None berarti default
+    if nilai is None or nilai == "":
+        return FIELD_DEFAULT
+    if isinstance(nilai, str):
+        nilai = nilai.split(",")
+    if not isinstance(nilai, list):
+        raise ValueError("Field 'fields' harus berupa daftar atau teks dipisah koma")
+    fields = tuple(f.strip() for f in nilai if isinstance(f, str) and f.strip())
+    salah = [f for f in fields if f not in FIELD_VALID]
+    if salah or not fields:
+        raise ValueError(f"Field tidak dikenal: {', '.join(salah) or '-'}. Pilihan: {', '.join(FIELD_VALID)}")
+    return fields
+
+
+def pilih_fields(data, fields):
+    return {k: data[k] for k in fields if k in data}
+
+
+def _encoding_diterima(accept_encoding):
+    diterima = set()
+    for bagian in (accept_encoding or "").split(","):
+        nama, _, param = bagian.strip().partition(";")
+        if param.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        diterima.add(nama.strip().lower())
+    return diterima
+
+
+def kompres(body, accept_encoding):
+    # mengembalikan (body, content-encoding atau None)
+    if len(body) < UKURAN_MIN_KOMPRES:
+        return body, None
+    diterima = _encoding_diterima(accept_encoding)
+    if brotli is not None and "br" in diterima:
+        return brotli.compress(body, quality=5), "br"
+    if "gzip" in diterima or "*" in diterima:
+        return gzip.compress(body, compresslevel=6), "gzip"
+    return body, None
+
+
+def buat_etag(body):
+    # ETag lemah: isi yang sama dikirim gzip, brotli, atau apa adanya dengan tag yang sama
+    return 'W/"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+def etag_cocok(if_none_match, etag):
+    # perbandingan lemah (RFC 9110): awalan W/ diabaikan di kedua sisi
+    if not if_none_match:
+        return False
+    daftar = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in daftar or etag.removeprefix("W/") in daftar
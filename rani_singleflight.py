@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# RANI SINGLEFLIGHT - Gabungkan pertanyaan identik yang sedang diproses bersamaan.
+# Request pertama (pemimpin) menjalankan embedding + Gemini; request lain dengan kunci yang
+# sama menunggu lalu menerima hasil yang sama. Tidak ada risiko basi: hasil tidak disimpan
+# setelah panggilan selesai.
+
+import asyncio
+import threading
+
+
+class _Panggilan:
+    def __init__(self):
+        self.selesai = threading.Event()
+        self.hasil = None
+        self.error = None
+
+
+class SingleFlight:
+    # versi thread (Flask)
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._berjalan = {}
+        self.panggilan = 0
+        self.dihemat = 0
+
+    def jalankan(self, kunci, fungsi):
+        # mengembalikan (hasil, gabung); gabung=True bila hasil diambil dari panggilan lain
+        with self._lock:
+            self.panggilan += 1
+            p = self._berjalan.get(kunci)
+            pemimpin = p is None
+            if pemimpin:
+                p = self._berjalan[kunci] = _Panggilan()
+            else:
+                self.dihemat += 1
+
+        if not pemimpin:
+            p.selesai.wait()
+            if p.error is not None:
+                raise p.error
+            return p.hasil, True
+
+        try:
+            p.hasil = fungsi()
+        except Exception as e:
+            p.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._berjalan[kunci]
+            p.selesai.set()
+        return p.hasil, False
+
+    def statistik(self):
+        return {"panggilan": self.panggilan, "dihemat": self.dihemat, "berjalan": len(self._berjalan)}
+
+
+class SingleFlightAsync:
+    # versi asyncio (mode --async). Pekerjaan bersama berjalan sebagai task sendiri, jadi
+    # putusnya klien pemimpin tidak membatalkan jawaban untuk penunggu lain; task baru
+    # dibatalkan bila semua penunggunya sudah putus.
+    def __init__(self):
+        self._berjalan = {}
+        self.panggilan = 0
+        self.dihemat = 0
+
+    async def jalankan(self, kunci, fungsi):
+        self.panggilan += 1
+        entri = self._berjalan.get(kunci)
+        gabung = entri is not None
+        if gabung:
+            self.dihemat += 1
+        else:
+            entri = {"task": asyncio.ensure_future(fungsi()), "penunggu": 0}
+            self._berjalan[kunci] = entri
+            entri["task"].add_done_callback(lambda _: self._lepas(kunci, entri))
+
+        entri["penunggu"] += 1
+        try:
+            hasil = await asyncio.shield(entri["task"])
+        except asyncio.CancelledError:
+            entri["penunggu"] -= 1
+            if entri["penunggu"] == 0 and not entri["task"].done():
+                # lepas sekarang, bukan menunggu done-callback: request yang datang sebelum
+                # callback berjalan harus memulai task baru, bukan ikut task yang dibatalkan
+                self._lepas(kunci, entri)
+                entri["task"].cancel()
+            raise
+        entri["penunggu"] -= 1
+        return hasil, gabung
+
+    def _lepas(self, kunci, entri):
+        if self._berjalan.get(kunci) is entri:
+            del self._berjalan[kunci]
+
+    def statistik(self):
+        return {"panggilan": self.panggilan, "dihemat": self.dihemat, "berjalan": len(self._berjalan)}
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# RANI SYARAT - Indeks terstruktur "syarat perkara" dari bagian 1 sumber.txt
+# Dipakai sebagai jalur cepat tanpa LLM: daftar syarat dikembalikan apa adanya.
+
+import re
+
+# Alias tambahan di luar nama yang tertulis di sumber.txt
+ALIAS = {
+    "cerai_gugat": ["gugat cerai", "gugatan cerai", "cerai istri"],
+    "cerai_talak": ["talak", "cerai suami"],
+    "hak_asuh_anak": ["hak asuh", "hadhanah", "hadanah", "asuh anak"],
+    "harta_bersama": ["gono gini", "gonogini", "harta gono gini"],
+    "gugat_waris": ["gugatan waris", "sengketa waris"],
+    "dispensasi_nikah": ["dispensasi kawin", "dispensasi", "diska"],
+    "isbat_nikah": ["itsbat nikah", "itsbat", "isbat", "nikah siri"],
+    "penetapan_ahli_waris": ["ahli waris", "pam"],
+    "pengangkatan_anak": ["adopsi", "angkat anak", "anak angkat"],
+    "wali_adhal": ["wali adhol", "wali enggan"],
+    "izin_poligami": ["poligami", "istri kedua", "beristri lebih dari satu"],
+    "asal_usul_anak": ["asal usul", "usul anak"],
+    "perwalian": ["wali anak", "menjadi wali"],
+}
+
+# dicocokkan per kata utuh pada teks yang sudah dinormalisasi
+KATA_SYARAT = ["syarat", "persyaratan", "kelengkapan", "dibawa", "bawa apa", "perlu disiapkan",
+               "harus disiapkan", "dokumen apa", "berkas apa", "apa saja dokumen", "apa saja berkas"]
+# pertanyaan yang juga menanyakan hal lain (biaya, waktu, alasan, ...) diteruskan ke LLM,
+# supaya bagian pertanyaan selebihnya tidak terbuang oleh jawaban daftar syarat
+KATA_NIAT_LAIN = ["biaya", "berapa", "kapan", "alasan", "lama", "bayar", "dibayar", "panjar", "sidang",
+                  "sidangnya", "jadwal", "prosedur", "proses", "prosesnya", "tahapan"]
+
+_RE_JUDUL = re.compile(r"^([A-Z])\.\s+(.*)$")
+_RE_PERAN = re.compile(r"^([a-z])\.\s+(.*)$")
+_RE_ITEM = re.compile(r"^(\d+)\.\s+(.*)$")
+_RE_NB = re.compile(r"^NB\s*:\s*(.*)$")
+
+
+def normalisasi(teks):
+    teks = teks.lower().replace("/", " ").replace("-", " ")
+    teks = re.sub(r"[^\w\s]", " ", teks)
+    return re.sub(r"\s+", " ", teks).strip()
+
+
+def _ada_kata(teks, daftar):
+    teks = f" {teks} "
+    return any(f" {k} " in teks for k in daftar)
+
+
+def _kunci(nama):
+    return normalisasi(nama).replace(" ", "_")
+
+
+def _rapikan(teks):
+    teks = re.sub(r"\s+", " ", teks).strip()
+    return re.sub(r"\.{2,}$", ".", teks)
+
+
+def _bagian_syarat(sumber_teks):
+    # bagian 1 berjalan dari judul "1. ..." sampai baris kosong pertama
+    baris = sumber_teks.splitlines()
+    for i, b in enumerate(baris):
+        if "SYARAT" in b.upper() and _RE_ITEM.match(b.strip()):
+            hasil = []
+            for b2 in baris[i + 1:]:
+                if not b2.strip():
+                    break
+                hasil.append(b2.strip())
+            return hasil
+    return []
+
+
+def parse_syarat(sumber_teks):
+    indeks = {}
+    entri = None
+    daftar = None
+    for baris in _bagian_syarat(sumber_teks):
+        m = _RE_JUDUL.match(baris)
+        if m:
+            judul = m.group(2).strip()
+            nama = re.sub(r"^SYARAT\s+PERKARA\s+", "", judul, flags=re.IGNORECASE)
+            # sumber.txt menulis "ASAL PERKARA USUL ANAK" untuk perkara asal usul anak
+            nama = re.sub(r"^ASAL\s+PERKARA\s+USUL", "ASAL USUL", nama, flags=re.IGNORECASE)
+            keterangan = None
+            k = re.match(r"^(.*?)\s*\((.*)\)\s*$", nama)
+            if k:
+                nama, keterangan = k.group(1), k.group(2)
+            kunci = _kunci(nama.split("/")[0])
+            alias = {normalisasi(nama), normalisasi(nama.split("/")[0])}
+            alias |= {normalisasi(a) for a in ALIAS.get(kunci, [])}
+            entri = {
+                "jenis": kunci,
+                "nama": nama.title(),
+                "keterangan": keterangan,
+                "dokumen": [],
+                "peran": {},
+                "catatan": None,
+                "alias": sorted(alias),
+            }
+            indeks[kunci] = entri
+            daftar = entri["dokumen"]
+            continue
+        if entri is None:
+            continue
+        m = _RE_PERAN.match(baris)
+        if m:
+            daftar = entri["peran"].setdefault(normalisasi(m.group(2)), [])
+            continue
+        m = _RE_NB.match(baris)
+        if m:
+            entri["catatan"] = _rapikan(m.group(1))
+            continue
+        m = _RE_ITEM.match(baris)
+        if m:
+            daftar.append(_rapikan(m.group(2)))
+        elif daftar:
+            # baris lanjutan dari item sebelumnya
+            daftar[-1] = _rapikan(f"{daftar[-1]} {baris}")
+    return indeks
+
+
+class IndeksSyarat:
+    def __init__(self, sumber_teks):
+        self.data = parse_syarat(sumber_teks)
+        # alias terpanjang dicek lebih dulu: "penetapan ahli waris" sebelum "waris"
+        self.alias = sorted(
+            ((a, kunci) for kunci, e in self.data.items() for a in e["alias"]),
+            key=lambda x: -len(x[0]),
+        )
+
+    def daftar_jenis(self):
+        return [
+            {"jenis": e["jenis"], "nama": e["nama"], "peran": list(e["peran"]), "alias": e["alias"]}
+            for e in self.data.values()
+        ]
+
+    def cari_jenis(self, teks):
+        teks = f" {normalisasi(teks)} "
+        for alias, kunci in self.alias:
+            if f" {alias} " in teks:
+                return kunci
+        return None
+
+    def ambil(self, jenis, peran=None):
+        kunci = jenis if jenis in self.data else self.cari_jenis(jenis or "")
+        if not kunci:
+            return None
+        e = dict(self.data[kunci])
+        if peran and e["peran"]:
+            peran = normalisasi(peran)
+            if peran not in e["peran"]:
+                return None
+            e["peran"] = {peran: e["peran"][peran]}
+        return e
+
+    def cocokkan(self, pertanyaan):
+        # jalur cepat hanya untuk pertanyaan yang jelas menanyakan syarat suatu jenis perkara
+        teks = normalisasi(pertanyaan)
+        if not _ada_kata(teks, KATA_SYARAT) or _ada_kata(teks, KATA_NIAT_LAIN):
+            return None
+        kunci = self.cari_jenis(teks)
+        if not kunci:
+            return None
+        peran = next((p for p in self.data[kunci]["peran"] if p in teks.split()), None)
+        return self.ambil(kunci, peran)
+
+
+def format_syarat(e):
+    judul = f"📋 Syarat Perkara {e['nama']}"
+    if e["keterangan"]:
+        judul += f" ({e['keterangan']})"
+    baris = [judul + ":"]
+    if e["peran"]:
+        for peran, dokumen in e["peran"].items():
+            baris.append(f"\n{peran.title()}:")
+            baris += [f"{i}. {d}" for i, d in enumerate(dokumen, 1)]
+    else:
+        baris += [f"{i}. {d}" for i, d in enumerate(e["dokumen"], 1)]
+    if e["catatan"]:
+        baris.append(f"\nNB: {e['catatan']}")
+    return "\n".join(baris)